@@ -1,3 +1,9 @@
+import functools
+import os
+import re
+import sys
+import textwrap
+
 import ply.lex as lex
 import ply.yacc as yacc
 
@@ -29,14 +35,8 @@ t_LESS = r'<'
 t_GREATER = r'>'
 t_LESSEQUAL = r'<='
 t_GREATEREQUAL = r'>='
-
-def t_LEFTSHIFT(t):
-    r'<<'
-    return t
-
-def t_RIGHTSHIFT(t):
-    r'>>'
-    return t
+t_LEFTSHIFT = r'<<'
+t_RIGHTSHIFT = r'>>'
 
 reserved = {
     'include': 'INCLUDE',
@@ -56,13 +56,16 @@ reserved = {
 
 def t_IDENTIFIER(t):
     r'[a-zA-Z_][a-zA-Z_0-9]*'
+    # Interning lets the reserved lookup (and any later comparisons) hit
+    # the identity fast path, and repeated identifiers share one object.
+    t.value = sys.intern(t.value)
     t.type = reserved.get(t.value, 'IDENTIFIER')
     return t
 
-def t_NUMBER(t):
-    r'\d+(\.\d+)?'
-    t.value = float(t.value) if '.' in t.value else int(t.value)
-    return t
+# Numbers keep their lexeme string: the parser never does arithmetic on
+# them, codegen re-emits the literal verbatim, and string values flow
+# through the fragment joins without per-token int/float conversion.
+t_NUMBER = r'\d+(\.\d+)?'
 
 def t_STRING_LITERAL(t):
     r'"[^"]*"'
@@ -76,17 +79,30 @@ def t_error(t):
     t.lexer.skip(1)
 
 # Parser
+INDENT = '    '
+
+def _is_nonblank(line):
+    return line.strip() != ''
+
+def indent(code):
+    # textwrap.indent prefixes every line in one call instead of looping
+    # over the lines at the Python level.
+    return textwrap.indent(code.rstrip('\n'), INDENT, _is_nonblank) + '\n'
+
 def p_program(p):
     '''program : statements'''
-    p[0] = p[1]
+    p[0] = ''.join(p[1])
 
 def p_statements(p):
     '''statements : statement
                   | statements statement'''
+    # Each statement is already a list of fragments; splice the new one
+    # onto the running list in place so no intermediate strings are built.
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + p[2]
+        p[1].extend(p[2])
+        p[0] = p[1]
 
 def p_statement(p):
     '''statement : include_statement
@@ -101,19 +117,22 @@ def p_statement(p):
                  | function_call
                  | return_statement
                  | expression SEMICOLON'''
-    p[0] = p[1]
+    p[0] = p[1] if len(p) == 2 else [p[1]]
+
+# Constant code snippets, built once instead of per reduction.
+INCLUDE_SNIPPET = "# C++ iostream included\n"
 
 def p_include_statement(p):
     'include_statement : INCLUDE LESS IOSTREAM GREATER'
-    p[0] = "# C++ iostream included\n"
+    p[0] = [INCLUDE_SNIPPET]
 
 def p_declaration(p):
     '''declaration : type IDENTIFIER SEMICOLON
                    | type IDENTIFIER EQUALS expression SEMICOLON'''
     if len(p) == 4:
-        p[0] = f"{p[2]} = None  # {p[1]} in C++\n"
+        p[0] = [f"{p[2]} = None  # {p[1]} in C++\n"]
     else:
-        p[0] = f"{p[2]} = {p[4]}  # {p[1]} in C++\n"
+        p[0] = [f"{p[2]} = {p[4]}  # {p[1]} in C++\n"]
 
 def p_type(p):
     '''type : INT
@@ -124,90 +143,105 @@ def p_type(p):
 
 def p_assignment(p):
     'assignment : IDENTIFIER EQUALS expression SEMICOLON'
-    p[0] = f"{p[1]} = {p[3]}\n"
+    p[0] = [f"{p[1]} = {p[3]}\n"]
 
 def p_cout_statement(p):
     'cout_statement : COUT LEFTSHIFT expression SEMICOLON'
-    p[0] = f"print({p[3]})\n"
+    p[0] = [f"print({p[3]})\n"]
 
 def p_cin_statement(p):
     'cin_statement : CIN RIGHTSHIFT IDENTIFIER SEMICOLON'
-    p[0] = f"{p[3]} = input()\n"
+    p[0] = [f"{p[3]} = input()\n"]
 
 def p_if_statement(p):
     '''if_statement : IF LPAREN expression RPAREN compound_statement
                     | IF LPAREN expression RPAREN compound_statement ELSE compound_statement'''
     if len(p) == 6:
-        p[0] = f"if {p[3]}:\n{p[5]}"
+        p[0] = [f"if {p[3]}:\n", p[5]]
     else:
-        p[0] = f"if {p[3]}:\n{p[5]}else:\n{p[7]}"
+        p[0] = [f"if {p[3]}:\n", p[5], "else:\n", p[7]]
 
 def p_while_statement(p):
     'while_statement : WHILE LPAREN expression RPAREN compound_statement'
-    p[0] = f"while {p[3]}:\n{p[5]}"
+    p[0] = [f"while {p[3]}:\n", p[5]]
 
 def p_for_statement(p):
     'for_statement : FOR LPAREN expression SEMICOLON expression SEMICOLON expression RPAREN compound_statement'
-    p[0] = f"{p[3]}\nwhile {p[5]}:\n{p[9]}    {p[7]}\n"
+    p[0] = [f"{p[3]}\nwhile {p[5]}:\n", p[9], f"{INDENT}{p[7]}\n"]
 
 def p_compound_statement(p):
     'compound_statement : LBRACE statements RBRACE'
-    p[0] = '    ' + p[2].replace('\n', '\n    ').rstrip() + '\n'
+    body = ''.join(p[2])
+    p[0] = indent(body)
 
 def p_function_definition(p):
     'function_definition : type IDENTIFIER LPAREN parameters RPAREN compound_statement'
-    p[0] = f"def {p[2]}({p[4]}):\n{p[6]}"
+    p[0] = [f"def {p[2]}({', '.join(p[4])}):\n", p[6]]
 
 def p_parameters(p):
-    '''parameters : type IDENTIFIER
-                  | type IDENTIFIER COMMA parameters
+    '''parameters : parameter_list
                   | '''
-    if len(p) == 1:
-        p[0] = ""
-    elif len(p) == 3:
-        p[0] = p[2]
+    p[0] = p[1] if len(p) == 2 else []
+
+def p_parameter_list(p):
+    '''parameter_list : parameter_list COMMA type IDENTIFIER
+                      | type IDENTIFIER'''
+    # Left recursion keeps the parser stack flat: each parameter reduces
+    # immediately instead of piling up until the closing parenthesis.
+    # Names accumulate in a list and are joined once at the consumer.
+    # The empty alternative lives on parameters, not here, so a leading
+    # comma stays a syntax error.
+    if len(p) == 3:
+        p[0] = [p[2]]
     else:
-        p[0] = f"{p[2]}, {p[4]}"
+        p[1].append(p[4])
+        p[0] = p[1]
 
 def p_function_call(p):
     'function_call : IDENTIFIER LPAREN arguments RPAREN SEMICOLON'
-    p[0] = f"{p[1]}({p[3]})\n"
+    p[0] = [f"{p[1]}({', '.join(p[3])})\n"]
 
 def p_arguments(p):
-    '''arguments : expression
-                 | expression COMMA arguments
+    '''arguments : argument_list
                  | '''
-    if len(p) == 1:
-        p[0] = ""
-    elif len(p) == 2:
-        p[0] = p[1]
+    p[0] = p[1] if len(p) == 2 else []
+
+def p_argument_list(p):
+    '''argument_list : argument_list COMMA expression
+                     | expression'''
+    if len(p) == 2:
+        p[0] = [p[1]]
     else:
-        p[0] = f"{p[1]}, {p[3]}"
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_return_statement(p):
     'return_statement : RETURN expression SEMICOLON'
-    p[0] = f"return {p[2]}\n"
+    p[0] = [f"return {p[2]}\n"]
 
-def p_expression(p):
+# One action per production shape lets yacc dispatch straight to the
+# right formatter instead of re-deriving the shape from len(p) and p[1]
+# on every expression reduction.
+def p_expression_atom(p):
     '''expression : IDENTIFIER
                   | NUMBER
-                  | STRING_LITERAL
-                  | expression PLUS expression
+                  | STRING_LITERAL'''
+    p[0] = p[1]
+
+def p_expression_binop(p):
+    '''expression : expression PLUS expression
                   | expression MINUS expression
                   | expression TIMES expression
                   | expression DIVIDE expression
                   | expression LESS expression
                   | expression GREATER expression
                   | expression LESSEQUAL expression
-                  | expression GREATEREQUAL expression
-                  | LPAREN expression RPAREN'''
-    if len(p) == 2:
-        p[0] = p[1]
-    elif len(p) == 4:
-        if p[1] == '(':
-            p[0] = f"({p[2]})"
-        else:
-            p[0] = f"{p[1]} {p[2]} {p[3]}"
+                  | expression GREATEREQUAL expression'''
+    p[0] = f"{p[1]} {p[2]} {p[3]}"
+
+def p_expression_group(p):
+    'expression : LPAREN expression RPAREN'
+    p[0] = f"({p[2]})"
 
 def p_error(p):
     if p:
@@ -215,22 +249,54 @@ def p_error(p):
     else:
         print("Syntax error at EOF")
 
-# Build the lexer and parser
-lexer = lex.lex()
-parser = yacc.yacc()
-
-# Read input file
-with open('input.txt', 'r') as file:
-    cpp_code = file.read()
-
-# Parse and generate Python code
-python_code = parser.parse(cpp_code, lexer=lexer)
-
-# Write to output file
-with open('output.txt', 'w') as file:
-    if python_code is not None:
-        file.write(python_code)
-    else:
-        file.write("# Unable to convert C++ code. Please check your input and error messages.\n")
+class SlottedLexToken:
+    # Drop-in replacement for ply.lex.LexToken: __slots__ drops the
+    # per-token __dict__, shrinking the allocation made for every token.
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __str__(self):
+        return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+    def __repr__(self):
+        return str(self)
+
+# lex.py instantiates tokens through its module-global LexToken, so
+# rebinding it here makes the lexer hand out slotted tokens.
+lex.LexToken = SlottedLexToken
+
+# Build the lexer and parser once at import time; rebuilding the LALR tables
+# on every conversion is by far the most expensive part of a call.
+# re.ASCII keeps the master token regex on the fast ASCII-only matching
+# path; the grammar only accepts ASCII identifiers and digits anyway.
+lexer = lex.lex(reflags=re.VERBOSE | re.ASCII)
+# The pickled tables next to this module let yacc skip LALR table
+# generation entirely on import; it regenerates the pickle automatically
+# if the grammar changes.
+PARSER_PICKLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parser.pickle')
+parser = yacc.yacc(debug=False, picklefile=PARSER_PICKLE)
+
+@functools.lru_cache(maxsize=256)
+def convert_cpp_to_python(cpp_code):
+    # Nothing to translate in an empty program; skip the parser (which
+    # would only report a syntax error at EOF).
+    if not cpp_code.strip():
+        return ""
+    # Clone the lexer so concurrent callers don't share lexing state.
+    return parser.parse(cpp_code, lexer=lexer.clone())
+
+if __name__ == '__main__':
+    # Read input file
+    with open('input.txt', 'r') as file:
+        cpp_code = file.read()
+
+    # Parse and generate Python code
+    python_code = convert_cpp_to_python(cpp_code)
+
+    # Write to output file
+    with open('output.txt', 'w') as file:
+        if python_code is not None:
+            file.write(python_code)
+        else:
+            file.write("# Unable to convert C++ code. Please check your input and error messages.\n")
 
-print("Conversion completed. Check output.txt for the result.")
\ No newline at end of file
+    print("Conversion completed. Check output.txt for the result.")
\ No newline at end of file